@@ -2,29 +2,88 @@
 Redis caching service for high-performance API responses
 """
 
-import json
+import asyncio
 import hashlib
+import inspect
 import logging
-from typing import Any, Optional
+import os
+from typing import Any, Iterable, Mapping, Optional
 from functools import wraps
 
+import msgpack
+import orjson
 import redis.asyncio as redis
 from fastapi import Request
 
 logger = logging.getLogger(__name__)
 
+# Keys requested per SCAN cursor step / deleted per DEL command
+SCAN_COUNT = 1000
+DELETE_BATCH_SIZE = 256
+
+_redis_pool: Optional[redis.ConnectionPool] = None
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+def _serialize_default(value: Any) -> Any:
+    """Fallback for types the encoder does not handle natively."""
+    if hasattr(value, "model_dump"):  # pydantic response models
+        return value.model_dump()
+    return str(value)
+
+
+def get_async_redis_client() -> redis.Redis:
+    """Get an asyncio Redis client backed by the shared connection pool.
+
+    The pool is created on first use and reused by every client, so
+    concurrent requests multiplex over a bounded set of connections.
+    """
+    global _redis_pool
+    if _redis_pool is None:
+        _redis_pool = redis.ConnectionPool(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "0")),
+            password=os.getenv("REDIS_PASSWORD", None),
+            decode_responses=True,
+            max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "64")),
+            health_check_interval=30,
+            retry_on_timeout=True,
+        )
+    return redis.Redis(connection_pool=_redis_pool)
+
+
+async def close_redis_pool():
+    """Disconnect the shared connection pool, if one was created."""
+    global _redis_pool
+    if _redis_pool is not None:
+        await _redis_pool.disconnect()
+        _redis_pool = None
+
 
 class CacheService:
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
         self.default_ttl = 60  # 60 seconds default TTL
 
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        """Serialize a value for storage in Redis."""
+        return orjson.dumps(value, default=_serialize_default,
+                            option=_ORJSON_OPTIONS)
+
+    @staticmethod
+    def loads(raw: bytes | str) -> Any:
+        """Deserialize a value read back from Redis."""
+        return orjson.loads(raw)
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         try:
             cached_value = await self.redis.get(key)
             if cached_value:
-                return json.loads(cached_value)
+                return self.loads(cached_value)
         except Exception as e:
             logger.warning(f"Cache get error for key {key}: {e}")
         return None
@@ -33,13 +92,40 @@ class CacheService:
         """Set value in cache with TTL."""
         try:
             ttl = ttl or self.default_ttl
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = self.dumps(value)
             await self.redis.setex(key, ttl, serialized_value)
             return True
         except Exception as e:
             logger.warning(f"Cache set error for key {key}: {e}")
             return False
 
+    async def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get several values from cache in a single round-trip."""
+        if not keys:
+            return []
+        try:
+            cached_values = await self.redis.mget(keys)
+            return [self.loads(v) if v else None for v in cached_values]
+        except Exception as e:
+            logger.warning(f"Cache mget error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def mset(self, mapping: Mapping[str, Any],
+                   ttl: int = None) -> bool:
+        """Set several values with the same TTL in one pipeline."""
+        if not mapping:
+            return True
+        try:
+            ttl = ttl or self.default_ttl
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(key, ttl, self.dumps(value))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Cache mset error for {len(mapping)} keys: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         try:
@@ -49,48 +135,119 @@ class CacheService:
             logger.warning(f"Cache delete error for key {key}: {e}")
             return False
 
-    async def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching pattern."""
+    async def _unlink_matches(self, pattern: str) -> int:
+        """UNLINK keys matching pattern as SCAN finds them.
+
+        At most DELETE_BATCH_SIZE keys are held at a time; SCAN can
+        return a key more than once, so each batch is deduplicated.
+        """
+        deleted = 0
+        batch = set()
+        async for key in self.redis.scan_iter(match=pattern,
+                                              count=SCAN_COUNT):
+            batch.add(key)
+            if len(batch) >= DELETE_BATCH_SIZE:
+                deleted += await self.redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await self.redis.unlink(*batch)
+        return deleted
+
+    async def delete_patterns(self, patterns: Iterable[str]) -> int:
+        """Delete all keys matching any of the patterns.
+
+        Uses incremental SCAN rather than KEYS so Redis is never blocked
+        for other clients. Patterns are scanned concurrently and matches
+        are UNLINKed (memory freed in the background) in fixed-size
+        batches while the scan runs, so memory stays bounded. A key
+        matched by two patterns is only counted once, by whichever
+        UNLINK removes it.
+        """
+        patterns = list(patterns)
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                return await self.redis.delete(*keys)
-            return 0
+            deleted = await asyncio.gather(
+                *(self._unlink_matches(pattern) for pattern in patterns)
+            )
+            return sum(deleted)
         except Exception as e:
-            logger.warning(f"Cache delete pattern error for {pattern}: {e}")
+            logger.warning(f"Cache delete pattern error for {patterns}: {e}")
             return 0
 
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching pattern."""
+        return await self.delete_patterns([pattern])
+
+
+class MsgpackCacheService(CacheService):
+    """Cache service storing msgpack payloads, for binary-heavy values.
+
+    Requires a Redis client created with ``decode_responses=False``.
+    """
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True,
+                             default=_serialize_default)
+
+    @staticmethod
+    def loads(raw: bytes | str) -> Any:
+        return msgpack.unpackb(raw, raw=False)
+
 
 def cache_key_for_request(request: Request, prefix: str = "") -> str:
-    """Generate cache key for request based on path and query params."""
+    """Generate cache key for request based on path and query params.
+
+    Keys keep the readable ``{prefix}:{path}`` part so they can be
+    invalidated by pattern; only the query string is hashed.
+    """
     path = request.url.path
-    query_params = str(sorted(request.query_params.items()))
-    key_string = f"{prefix}:{path}:{query_params}"
-    return hashlib.md5(key_string.encode()).hexdigest()
+    h = hashlib.blake2b(digest_size=16)
+    # Sort so that ?a=1&b=2 and ?b=2&a=1 share one cache entry
+    for k, v in sorted(request.query_params.multi_items()):
+        h.update(k.encode())
+        h.update(b"=")
+        h.update(v.encode())
+        h.update(b"&")
+    return f"{prefix}:{path}:{h.hexdigest()}"
+
+
+SUMMARY_CACHE_TTL = 3600  # summaries of an identical transcript never change
+
+
+def summary_cache_key(transcript: str) -> str:
+    """Cache key for the summary of ``transcript``."""
+    digest = hashlib.blake2b(transcript.encode(), digest_size=16).hexdigest()
+    return f"sum:{digest}"
+
+
+def _param_name_for(sig: inspect.Signature, annotation: type) -> Optional[str]:
+    """Name of the first parameter annotated with the given type."""
+    return next((name for name, param in sig.parameters.items()
+                 if param.annotation is annotation), None)
 
 
 def cached_endpoint(ttl: int = 60, key_prefix: str = "api"):
-    """Decorator for caching API endpoint responses."""
+    """Decorator for caching API endpoint responses.
+
+    The decorated endpoint must declare a ``Request`` parameter and a
+    ``CacheService`` dependency; both are located once, when the
+    decorator is applied, and read from kwargs on each call.
+    """
     def decorator(func):
+        sig = inspect.signature(func)
+        request_name = _param_name_for(sig, Request)
+        cache_name = _param_name_for(sig, CacheService)
+        if request_name is None or cache_name is None:
+            raise TypeError(f"{func.__name__} needs Request and "
+                            "CacheService parameters to be cached")
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Extract request from kwargs (FastAPI dependency injection)
-            request = None
-            cache_service = None
-
-            for arg in args:
-                if hasattr(arg, 'url'):  # FastAPI Request object
-                    request = arg
-                    break
-
-            for key, value in kwargs.items():
-                if isinstance(value, CacheService):
-                    cache_service = value
-                    break
-                elif hasattr(value, 'url'):  # Request in kwargs
-                    request = value
-
-            if not request or not cache_service:
+            # FastAPI passes endpoint parameters as keyword arguments
+            request = kwargs.get(request_name)
+            cache_service = kwargs.get(cache_name)
+
+            if request is None or cache_service is None:
                 # If no cache service or request, just execute function
                 return await func(*args, **kwargs)
 
@@ -124,8 +281,7 @@ MEETING_CACHE_PATTERNS = [
 
 async def invalidate_meeting_caches(cache_service: CacheService):
     """Invalidate all meeting-related caches."""
-    for pattern in MEETING_CACHE_PATTERNS:
-        deleted_count = await cache_service.delete_pattern(pattern)
-        if deleted_count > 0:
-            logger.info(f"Invalidated {deleted_count} cache entries "
-                        f"for pattern: {pattern}")
+    deleted_count = await cache_service.delete_patterns(MEETING_CACHE_PATTERNS)
+    if deleted_count > 0:
+        logger.info(f"Invalidated {deleted_count} cache entries "
+                    f"for patterns: {MEETING_CACHE_PATTERNS}")
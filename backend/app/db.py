@@ -1,5 +1,6 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from dotenv import load_dotenv
 
@@ -14,7 +15,19 @@ port = os.getenv("POSTGRES_PORT", "5432")
 db = os.getenv("POSTGRES_DB")
 
 DATABASE_URL = f"postgresql://{user}:{password}@{host}:{port}/{db}"
+ASYNC_DATABASE_URL = (f"postgresql+asyncpg://{user}:{password}@{host}:{port}"
+                      f"/{db}")
 
 Base = declarative_base()
 engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine for the API; request handlers share this pool
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    pool_pre_ping=True,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False,
+                                       expire_on_commit=False)
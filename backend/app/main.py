@@ -1,29 +1,42 @@
 from fastapi import (FastAPI, File, UploadFile, HTTPException, Depends,
                      status, Request, Query)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from app.db import SessionLocal, engine, Base
-from typing import List, Optional
+from fastapi.responses import (ORJSONResponse, Response,
+                               StreamingResponse)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import literal_column, select
+from app.db import AsyncSessionLocal
+from typing import TYPE_CHECKING, AsyncIterator, List
 from dotenv import load_dotenv
-from app.models import Meeting
+from app.models import Meeting, utc_now
 from app.schemas import MeetingListItem, MeetingDetail
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
+from functools import wraps
 from app.util import get_audio_duration_seconds, extract_keywords
 from app.redis_client import get_redis_client, TaskQueue
-from app.cache import (CacheService, cached_endpoint,
-                       invalidate_meeting_caches)
+from app.cache import (SUMMARY_CACHE_TTL, CacheService, cached_endpoint,
+                       close_redis_pool, get_async_redis_client,
+                       invalidate_meeting_caches, summary_cache_key)
 from pathlib import Path
-import shutil
+from starlette.formparsers import MultiPartParser
+import aiofiles
+import asyncio
+import hmac
 import os
 import subprocess
+import sys
+import time
 import uuid
-import openai
-from faster_whisper import WhisperModel
+import numpy as np
+import orjson
 import httpx
 
+if TYPE_CHECKING:
+    # Heavy imports; loaded at runtime only where they are first needed
+    from faster_whisper import WhisperModel
+    from openai import AsyncOpenAI
+
 load_dotenv()  # Load .env
 load_dotenv(".env.local", override=True)  # Load .env.local with override
 user = os.getenv("POSTGRES_USER")
@@ -34,40 +47,83 @@ db = os.getenv("POSTGRES_DB")
 DATABASE_URL = f"postgresql://{user}:{password}@{host}:{port}/{db}"
 
 
+MIGRATION_LOCK_KEY = "migrate:lock"
+MIGRATION_LOCK_TTL = 60
+
+
+def _run_migrations():
+    # Only one process per deploy applies migrations; the rest skip instead
+    # of racing each other through the same DDL
+    token = uuid.uuid4().hex
+    try:
+        lock = get_redis_client()
+        if not lock.set(MIGRATION_LOCK_KEY, token, nx=True,
+                        ex=MIGRATION_LOCK_TTL):
+            print("Migrations running in another process, skipping")
+            return
+    except Exception as e:
+        print(f"Warning: Could not take migration lock: {e}")
+        lock = None
+
+    try:
+        from app.migrations.migrate import run_migrations
+        run_migrations()
+        print("Database migrations completed")
+    except Exception as e:
+        print(f"Warning: Migration failed: {e}")
+    finally:
+        try:
+            if lock is not None and lock.get(MIGRATION_LOCK_KEY) == token:
+                lock.delete(MIGRATION_LOCK_KEY)
+        except Exception:
+            pass  # the lock expires on its own
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    global _fw_model, _task_queue, _cache_service
+    global _fw_model, _task_queue, _cache_service, _http_client
     # Only load model if we're not using the worker service
     use_worker = os.getenv("USE_WORKER_SERVICE", "true").lower() == "true"
     if not use_worker:
-        _fw_model = WhisperModel(FW_MODEL, device="cpu",
-                                 compute_type=FW_COMPUTE_TYPE)
+        from faster_whisper import WhisperModel
+        _fw_model = WhisperModel(FW_MODEL, device=FW_DEVICE,
+                                 compute_type=FW_COMPUTE_TYPE,
+                                 cpu_threads=FW_CPU_THREADS,
+                                 num_workers=FW_NUM_WORKERS)
 
     # Initialize Redis task queue and cache service
     try:
-        redis_client = get_redis_client()
-        _task_queue = TaskQueue(redis_client)
-        _cache_service = CacheService(redis_client)
+        _task_queue = TaskQueue(get_redis_client())
+        _cache_service = CacheService(get_async_redis_client())
         print("Redis connected: Task queue and cache service initialized")
     except Exception as e:
         print(f"Warning: Could not connect to Redis: {e}")
         _task_queue = None
         _cache_service = None
 
-    # Run database migrations
-    try:
-        from app.migrations.migrate import run_migrations
-        run_migrations()
-        print("Database migrations completed")
-    except Exception as e:
-        print(f"Warning: Migration failed: {e}")
+    # Schema comes from app/migrations; deploys that run them as a separate
+    # step set RUN_MIGRATIONS=false so workers skip the DDL round-trips
+    if os.getenv("RUN_MIGRATIONS", "true").lower() == "true":
+        await asyncio.to_thread(_run_migrations)
+
+    # One pooled client keeps connections to Ray Serve alive across requests
+    _http_client = httpx.AsyncClient(
+        base_url=RAY_SERVE_URL,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=32,
+                            max_connections=64),
+    )
 
     yield
+    await _http_client.aclose()
+    _http_client = None
     _fw_model = None
     _task_queue = None
     _cache_service = None
+    await close_redis_pool()
 
-app = FastAPI(title="AI Meeting Insights", lifespan=lifespan)
+app = FastAPI(title="AI Meeting Insights", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -77,34 +133,43 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-Base.metadata.create_all(bind=engine)
-
-openai.api_key = os.getenv("OPENAI_API_KEY")
+# Read once at import; an empty key disables API key checks
+API_KEY = os.getenv("API_KEY", "").encode()
 
 UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "app/uploads"))
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 FW_MODEL = os.getenv("FW_MODEL", "base.en")
-FW_COMPUTE_TYPE = os.getenv("FW_COMPUTE_TYPE", "float32")
-_fw_model: WhisperModel | None = None
+FW_DEVICE = os.getenv("FW_DEVICE", "cpu")
+# int8 weights halve memory traffic; on GPU keep activations in float16
+FW_COMPUTE_TYPE = os.getenv(
+    "FW_COMPUTE_TYPE", "int8_float16" if FW_DEVICE == "cuda" else "int8")
+FW_CPU_THREADS = int(os.getenv("FW_CPU_THREADS", os.cpu_count() or 0))
+FW_NUM_WORKERS = int(os.getenv("FW_NUM_WORKERS", "2"))
+# Greedy by default; the summary smooths over the odd ASR slip
+FW_BEAM_SIZE = int(os.getenv("FW_BEAM_SIZE", "1"))
+# Fixing the language skips detection on multilingual models
+FW_LANG = os.getenv("FW_LANG") or ("en" if FW_MODEL.endswith(".en")
+                                   else None)
+_fw_model: "WhisperModel | None" = None
 _task_queue: TaskQueue | None = None
 _cache_service: CacheService | None = None
+_openai_client: "AsyncOpenAI | None" = None
+_http_client: httpx.AsyncClient | None = None
 
+RAY_SERVE_URL = os.getenv("RAY_SERVE_URL", "http://localhost:10001")
 
-def get_db():
-    db = SessionLocal()
-    try:
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 def verify_api_key(request: Request):
-    api_key = os.getenv("API_KEY")
-    if not api_key:
+    if not API_KEY:
         return
-    header_key = request.headers.get("x-api-key")
-    if header_key != api_key:
+    header_key = (request.headers.get("x-api-key") or "").encode()
+    if not hmac.compare_digest(header_key, API_KEY):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                             detail="Invalid API Key")
 
@@ -117,8 +182,7 @@ def optional_api_key_dependency(request: Request):
     try:
         return verify_api_key(request)
     except HTTPException:
-        api_key = os.getenv("API_KEY")
-        if api_key:
+        if API_KEY:
             raise
         return None
 
@@ -131,14 +195,51 @@ def get_cache_service() -> CacheService:
     return _cache_service
 
 
-def _split_keywords(s: Optional[str]) -> Optional[List[str]]:
-    ks = [k.strip() for k in (s or "").split(",") if k.strip()]
-    return ks or None
+# List endpoints never return the transcript, so never load it
+_LIST_COLUMNS = (
+    Meeting.id,
+    Meeting.filename,
+    Meeting.created_at,
+    Meeting.summary,
+    Meeting.language,
+    Meeting.duration_seconds,
+    Meeting.keywords,
+)
+
+
+def _list_item(r) -> dict:
+    """A MeetingListItem as a plain dict; the columns are already typed."""
+    return {
+        "id": r.id,
+        "filename": r.filename,
+        "created_at": r.created_at,
+        "summary": r.summary,
+        "language": r.language,
+        "duration_seconds": r.duration_seconds,
+        "keywords": r.keywords or None,
+    }
+
+
+def _orjson_response(func):
+    """Send the endpoint's result straight through orjson.
+
+    With ``response_model=None`` FastAPI would still walk the result with
+    jsonable_encoder; returning a response skips that. The schema is kept
+    in the route's ``responses=`` instead. Apply it outside
+    ``cached_endpoint`` so the cache stores the plain result.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return ORJSONResponse(await func(*args, **kwargs))
+    return wrapper
+
+
+_LIST_RESPONSES = {200: {"model": List[MeetingListItem]}}
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
@@ -152,73 +253,128 @@ async def generic_exception_handler(request: Request, exc: Exception):
     if os.getenv("DEBUG"):
         print(f"Exception: {exc}")
         print(f"Traceback: {traceback.format_exc()}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": error_detail}
     )
 
 
+# Static bodies, encoded once; probes hit these far more than anything else
+_HEALTH_BODY = orjson.dumps({"status": "ok", "model": FW_MODEL})
+_ROOT_BODY = orjson.dumps({"message": "Welcome to AI Meeting Insights"})
+
+
 @app.get("/health")
 def health_check():
-    return {"status": "ok", "model": FW_MODEL}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
 def read_root():
-    return {"message": "Welcome to AI Meeting Insights"}
+    return Response(_ROOT_BODY, media_type="application/json")
+
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
 
-def _save_upload(file: UploadFile) -> Path:
+
+def _sendfile_upload(src_fd: int, dst: Path) -> None:
+    """Copy an on-disk upload to ``dst`` inside the kernel."""
+    size = os.fstat(src_fd).st_size
+    with dst.open("wb") as f:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(f.fileno(), src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+
+async def _save_upload(file: UploadFile) -> Path:
     """
     Save incoming UploadFile to UPLOAD_DIR with a safe filename.
     """
     safe_name = os.path.basename(file.filename or f"{uuid.uuid4().hex}.m4a")
     dst = UPLOAD_DIR / safe_name
-    with dst.open("wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # Uploads past the spool limit are already in a temp file; copy them
+    # in the kernel. Only Linux sendfile can write to a regular file.
+    if (sys.platform.startswith("linux") and file.size is not None
+            and file.size > MultiPartParser.spool_max_size):
+        try:
+            await asyncio.to_thread(_sendfile_upload, file.file.fileno(),
+                                    dst)
+            return dst
+        except OSError:
+            # e.g. a filesystem without sendfile support; copy in chunks
+            pass
+    async with aiofiles.open(dst, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
     return dst
 
 
-def _to_wav_16k_mono(src: Path) -> Path:
-    wav = src.with_suffix(".wav")
-    cmd = ["ffmpeg", "-y", "-i", str(src), "-ar", "16000", "-ac", "1",
-           str(wav)]
-    subprocess.run(cmd, check=True, capture_output=True)
-    return wav
+SAMPLE_RATE = 16000
 
 
-def transcribe_with_faster_whisper(src_path: Path) -> tuple[str, str | None]:
-    if _fw_model is None:
-        raise RuntimeError("faster-whisper model not loaded")
+async def _decode_pcm_16k_mono(src: Path) -> np.ndarray:
+    """Decode audio with ffmpeg straight into a float32 waveform."""
+    # -threads 0 / -filter_threads 0 let ffmpeg use every core
+    cmd = ["ffmpeg", "-threads", "0", "-filter_threads", "0", "-i", str(src),
+           "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "-"]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd,
+                                            output=stdout, stderr=stderr)
+    return np.frombuffer(stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
 
-    wav = _to_wav_16k_mono(src_path)
+def _run_faster_whisper(audio: np.ndarray) -> tuple[str, str | None]:
     segments, info = _fw_model.transcribe(
-        str(wav),
-        beam_size=5,
+        audio,
+        language=FW_LANG,
+        beam_size=FW_BEAM_SIZE,
+        best_of=1,
+        # Independent windows avoid repetition loops and are cheaper
+        condition_on_previous_text=False,
         vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500),
     )
     parts = [seg.text for seg in segments]
     return " ".join(parts).strip(), getattr(info, "language", None)
 
 
+async def transcribe_with_faster_whisper(
+        src_path: Path) -> tuple[str, str | None]:
+    if _fw_model is None:
+        raise RuntimeError("faster-whisper model not loaded")
+
+    audio = await _decode_pcm_16k_mono(src_path)
+    # Segments decode lazily while iterated, so the whole CPU-bound
+    # pass runs in the worker thread rather than on the event loop.
+    return await asyncio.to_thread(_run_faster_whisper, audio)
+
+
 @app.post("/upload-audio")
 async def upload_audio(file: UploadFile = File(...),
                        _: None = Depends(api_key_dependency)):
-    dst = _save_upload(file)
-    return JSONResponse(content={"filename": str(dst),
-                                 "msg": "Upload successful"})
+    dst = await _save_upload(file)
+    return {"filename": str(dst), "msg": "Upload successful"}
 
 
 @app.post("/transcribe-audio")
 async def transcribe_audio(file: UploadFile = File(...),
                            _: None = Depends(api_key_dependency)):
     try:
-        dst = _save_upload(file)
-        transcript = transcribe_with_faster_whisper(dst)
-        return JSONResponse(content={
+        dst = await _save_upload(file)
+        transcript, _ = await transcribe_with_faster_whisper(dst)
+        return {
             "filename": str(dst),
             "transcript": transcript
-        })
+        }
     except subprocess.CalledProcessError as e:
         raise HTTPException(status_code=500,
                             detail=e.stderr.decode("utf-8", "ignore"))
@@ -226,35 +382,87 @@ async def transcribe_audio(file: UploadFile = File(...),
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def summarize_meeting_transcript(transcript: str) -> str:
-    prompt = (
-        "Summarize the following meeting transcript in bullet points, "
-        "highlight action items, key decisions, and follow-up tasks. "
-        "Use clear English. Transcript:\n"
-        + transcript
-    )
-    completion = openai.chat.completions.create(
+def _get_openai_client() -> "AsyncOpenAI":
+    """Create the shared OpenAI client on first use."""
+    global _openai_client
+    if _openai_client is None:
+        from openai import AsyncOpenAI
+        _openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _openai_client
+
+
+_SUMMARY_PREFIX = (
+    "Summarize the following meeting transcript in bullet points, "
+    "highlight action items, key decisions, and follow-up tasks. "
+    "Use clear English. Transcript:"
+)
+
+
+async def _stream_summary(transcript: str) -> AsyncIterator[str]:
+    """Yield summary text fragments as the model produces them."""
+    if not transcript:
+        return
+    # Retries and re-uploads produce the same transcript; reuse its summary
+    key = summary_cache_key(transcript)
+    if _cache_service is not None:
+        cached = await _cache_service.get(key)
+        if cached is not None:
+            yield cached
+            return
+    stream = await _get_openai_client().chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[
             {"role": "system", "content": "You are a meeting assistant."},
-            {"role": "user", "content": prompt}
+            {"role": "user", "content": _SUMMARY_PREFIX},
+            {"role": "user", "content": transcript},
         ],
         temperature=0.2,
-        max_tokens=512
+        stream=True,
     )
-    return completion.choices[0].message.content or ""
+    parts = []
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+            yield parts[-1]
+    if _cache_service is not None and parts:
+        await _cache_service.set(key, "".join(parts), SUMMARY_CACHE_TTL)
+
+
+async def summarize_meeting_transcript(transcript: str) -> str:
+    return "".join([part async for part in _stream_summary(transcript)])
+
+
+async def _summary_events(transcript: str) -> AsyncIterator[bytes]:
+    """Frame summary fragments as server-sent events."""
+    async for part in _stream_summary(transcript):
+        yield b"data: " + orjson.dumps({"delta": part}) + b"\n\n"
+    yield b"event: done\ndata: {}\n\n"
 
 
 @app.post("/summarize")
 async def summarize_transcript(transcript: str,
                                _: None = Depends(api_key_dependency)):
-    summary = summarize_meeting_transcript(transcript) if transcript else ""
-    return {"summary": summary}
+    """Stream the summary as ``data: {"delta": ...}`` events."""
+    return StreamingResponse(_summary_events(transcript),
+                             media_type="text/event-stream")
+
+
+# Strong references so pending background tasks are not garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _invalidate_meeting_caches_soon():
+    """Drop list/search caches without holding up the response."""
+    if _cache_service is None:
+        return
+    task = asyncio.create_task(invalidate_meeting_caches(_cache_service))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 @app.post("/analyze-meeting")
 async def analyze_meeting(file: UploadFile = File(...),
-                          db: Session = Depends(get_db),
+                          db: AsyncSession = Depends(get_db),
                           _: None = Depends(api_key_dependency)):
     """
     Queue a meeting for async processing.
@@ -263,18 +471,18 @@ async def analyze_meeting(file: UploadFile = File(...),
     use_worker = os.getenv("USE_WORKER_SERVICE", "true").lower() == "true"
 
     # Save uploaded file
-    dst = _save_upload(file)
+    dst = await _save_upload(file)
 
     # Create meeting record with initial state
     m = Meeting(
         filename=os.path.basename(file.filename or "unknown.wav"),
         transcript="",  # Will be filled by worker
         summary="",     # Will be filled by worker
-        created_at=datetime.now(timezone.utc),
+        created_at=utc_now(),
     )
     db.add(m)
-    db.commit()
-    db.refresh(m)
+    await db.commit()
+    await db.refresh(m)
 
     if use_worker and _task_queue:
         # Queue the job for async processing
@@ -286,8 +494,7 @@ async def analyze_meeting(file: UploadFile = File(...),
             )
 
             # Invalidate meeting caches since we added a new meeting
-            if _cache_service:
-                await invalidate_meeting_caches(_cache_service)
+            _invalidate_meeting_caches_soon()
 
             return {
                 "status": "queued",
@@ -301,25 +508,35 @@ async def analyze_meeting(file: UploadFile = File(...),
 
     # Fallback: synchronous processing (if worker disabled or unavailable)
     try:
-        transcript, lang = transcribe_with_faster_whisper(dst)
-        summary = (summarize_meeting_transcript(transcript)
-                   if transcript else "")
-        duration = get_audio_duration_seconds(str(dst))
-        kw_list = extract_keywords(transcript, top_k=8)
-        kw_str = ",".join(kw_list) if kw_list else None
-
-        # Update meeting record
-        m.transcript = transcript
-        m.summary = summary
-        if lang:
-            m.language = lang
-        if duration is not None:
-            m.duration_seconds = duration
-        if kw_str:
-            m.keywords = kw_str
-
-        db.commit()
-        db.refresh(m)
+        transcript, lang = await transcribe_with_faster_whisper(dst)
+        # The OpenAI round-trip is the slowest remaining stage; start it
+        # now and store everything else while it is in flight.
+        summary_task = asyncio.create_task(
+            summarize_meeting_transcript(transcript))
+        try:
+            # ffprobe is a subprocess and the keyword pass is pure
+            # Python; keep both off the event loop
+            duration, kw_list = await asyncio.gather(
+                asyncio.to_thread(get_audio_duration_seconds, str(dst)),
+                asyncio.to_thread(extract_keywords, transcript, top_k=8),
+            )
+
+            # Update meeting record
+            m.transcript = transcript
+            if lang:
+                m.language = lang
+            if duration is not None:
+                m.duration_seconds = duration
+            if kw_list:
+                m.keywords = kw_list
+            await db.commit()
+
+            m.summary = await summary_task
+            await db.commit()
+            await db.refresh(m)
+        finally:
+            summary_task.cancel()  # no-op once the summary has finished
+        _invalidate_meeting_caches_soon()
 
         return {
             "status": "completed",
@@ -354,46 +571,51 @@ def get_job_status(job_id: str,
     return job_status
 
 
+QUEUE_STATS_TTL = 1.0
+_queue_stats: dict | None = None
+_queue_stats_at = 0.0
+
+
 @app.get("/queue-stats")
 def get_queue_stats(_: None = Depends(optional_api_key_dependency)):
     """Get current queue statistics."""
+    global _queue_stats, _queue_stats_at
     if not _task_queue:
         return {"error": "Task queue not available"}
 
-    return {
-        "queue_length": _task_queue.get_queue_length(),
-        "processing_count": _task_queue.get_processing_count(),
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    # Dashboards poll this; serve a snapshot at most QUEUE_STATS_TTL old
+    now = time.monotonic()
+    if _queue_stats is None or now - _queue_stats_at >= QUEUE_STATS_TTL:
+        queue_length, processing_count = _task_queue.get_stats()
+        _queue_stats = {
+            "queue_length": queue_length,
+            "processing_count": processing_count,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        _queue_stats_at = now
+    return _queue_stats
 
 
-@app.get("/meetings", response_model=List[MeetingListItem])
+@app.get("/meetings", response_model=None, responses=_LIST_RESPONSES)
+@_orjson_response
 @cached_endpoint(ttl=60, key_prefix="api")
 async def list_meetings(
     request: Request,
-    db: Session = Depends(get_db),
+    limit: int = Query(100, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
     cache: CacheService = Depends(get_cache_service),
     _: None = Depends(optional_api_key_dependency)
 ):
-    """List meetings with Redis caching for performance."""
-    rows = (
-        db.query(Meeting)
+    """List meetings, newest first, with Redis caching for performance."""
+    result = await db.execute(
+        select(*_LIST_COLUMNS)
         .order_by(Meeting.created_at.desc())
-        .limit(100)
-        .all()
+        .limit(limit)
+        .offset(offset)
     )
-    return [
-        MeetingListItem(
-            id=r.id,
-            filename=r.filename,
-            created_at=r.created_at,
-            summary=r.summary,
-            language=getattr(r, "language", None),
-            duration_seconds=getattr(r, "duration_seconds", None),
-            keywords=_split_keywords(getattr(r, "keywords", None)),
-        )
-        for r in rows
-    ]
+    rows = result.all()
+    return [_list_item(r) for r in rows]
 
 
 @app.post("/ray-summary")
@@ -411,31 +633,27 @@ async def ray_summary(
             raise HTTPException(status_code=400, detail="No text provided")
 
         # Forward request to Ray Serve
-        ray_serve_url = os.getenv("RAY_SERVE_URL", "http://localhost:10001")
+        response = await _http_client.post(
+            "/SummarizationService",
+            json={"text": text},
+            timeout=30.0
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{ray_serve_url}/SummarizationService",
-                json={"text": text},
-                timeout=30.0
+        if response.status_code == 200:
+            result = response.json()
+            return {
+                "summary": result.get("summary", ""),
+                "processing_time_ms": result.get("processing_time_ms", 0),
+                "service": "ray-serve",
+                "input_length": len(text),
+                "timestamp": result.get("timestamp")
+            }
+        else:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Ray Serve error: {response.text}"
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "summary": result.get("summary", ""),
-                    "processing_time_ms": result.get(
-                        "processing_time_ms", 0),
-                    "service": "ray-serve",
-                    "input_length": len(text),
-                    "timestamp": result.get("timestamp")
-                }
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Ray Serve error: {response.text}"
-                )
-
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Ray Serve timeout")
     except httpx.ConnectError:
@@ -450,24 +668,18 @@ async def ray_summary(
 async def ray_health():
     """Check Ray Serve health status."""
     try:
-        ray_serve_url = os.getenv("RAY_SERVE_URL", "http://localhost:10001")
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{ray_serve_url}/HealthCheck",
-                timeout=5.0
-            )
+        response = await _http_client.get("/HealthCheck", timeout=5.0)
 
-            if response.status_code == 200:
-                return {
-                    "ray_serve_status": "healthy",
-                    "ray_serve_response": response.json()
-                }
-            else:
-                return {
-                    "ray_serve_status": "unhealthy",
-                    "status_code": response.status_code
-                }
+        if response.status_code == 200:
+            return {
+                "ray_serve_status": "healthy",
+                "ray_serve_response": response.json()
+            }
+        else:
+            return {
+                "ray_serve_status": "unhealthy",
+                "status_code": response.status_code
+            }
 
     except Exception as e:
         return {
@@ -476,32 +688,38 @@ async def ray_health():
         }
 
 
-@app.get("/meetings/{meeting_id}", response_model=MeetingDetail)
-def get_meeting(meeting_id: int, db: Session = Depends(get_db),
-                _: None = Depends(optional_api_key_dependency)):
-    r = db.get(Meeting, meeting_id)
+@app.get("/meetings/{meeting_id}", response_model=None,
+         responses={200: {"model": MeetingDetail}})
+@_orjson_response
+async def get_meeting(meeting_id: int, db: AsyncSession = Depends(get_db),
+                      _: None = Depends(optional_api_key_dependency)):
+    result = await db.execute(
+        select(*_LIST_COLUMNS, Meeting.transcript)
+        .where(Meeting.id == meeting_id)
+    )
+    r = result.first()
     if not r:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    return MeetingDetail(
-        id=r.id,
-        filename=r.filename,
-        created_at=r.created_at,
-        language=getattr(r, "language", None),
-        duration_seconds=getattr(r, "duration_seconds", None),
-        keywords=_split_keywords(getattr(r, "keywords", None)),
-        transcript=r.transcript,
-        summary=r.summary,
-    )
+    return {
+        "id": r.id,
+        "filename": r.filename,
+        "created_at": r.created_at,
+        "language": r.language,
+        "duration_seconds": r.duration_seconds,
+        "keywords": r.keywords or None,
+        "transcript": r.transcript,
+        "summary": r.summary,
+    }
 
 
 @app.delete("/meetings/{meeting_id}")
-def delete_meeting(
+async def delete_meeting(
     meeting_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: None = Depends(optional_api_key_dependency),
 ):
-    r = db.get(Meeting, meeting_id)
+    r = await db.get(Meeting, meeting_id)
     if not r:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -514,48 +732,38 @@ def delete_meeting(
     except Exception:
         pass
 
-    db.delete(r)
-    db.commit()
+    await db.delete(r)
+    await db.commit()
+    _invalidate_meeting_caches_soon()
     return {"ok": True}
 
 
-@app.get("/search", response_model=List[MeetingListItem])
+# Must match the indexed expression in migrations/002_search_trgm_index.sql.
+# Keywords are left out: they are words taken from the transcript.
+SEARCH_DOCUMENT = literal_column(
+    "coalesce(meetings.filename, '') || ' ' || "
+    "coalesce(meetings.transcript, '') || ' ' || "
+    "coalesce(meetings.summary, '')"
+)
+
+
+@app.get("/search", response_model=None, responses=_LIST_RESPONSES)
+@_orjson_response
 @cached_endpoint(ttl=60, key_prefix="api")
 async def search_meetings(
     request: Request,
     q: str = Query(..., min_length=1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     cache: CacheService = Depends(get_cache_service),
     _: None = Depends(optional_api_key_dependency),
 ):
-    """Search meetings with optimized GIN indexes and Redis caching."""
-    like = f"%{q}%"
-
-    conds = [
-        Meeting.transcript.ilike(like),
-        Meeting.summary.ilike(like),
-        Meeting.filename.ilike(like),
-    ]
-    if hasattr(Meeting, "keywords"):
-        conds.append(Meeting.keywords.ilike(like))
-
-    rows = (
-        db.query(Meeting)
-        .filter(or_(*conds))
+    """Search meetings through the trigram index and Redis caching."""
+    result = await db.execute(
+        select(*_LIST_COLUMNS)
+        .where(SEARCH_DOCUMENT.ilike(f"%{q}%"))
         .order_by(Meeting.created_at.desc())
         .limit(100)
-        .all()
     )
+    rows = result.all()
 
-    return [
-        MeetingListItem(
-            id=r.id,
-            filename=r.filename,
-            created_at=r.created_at,
-            summary=r.summary,
-            language=getattr(r, "language", None),
-            duration_seconds=getattr(r, "duration_seconds", None),
-            keywords=_split_keywords(getattr(r, "keywords", None)),
-        )
-        for r in rows
-    ]
+    return [_list_item(r) for r in rows]
@@ -0,0 +1,15 @@
+-- Base schema for meeting insights
+-- Mirrors app.models.Meeting; later migrations add indexes on top
+
+CREATE TABLE IF NOT EXISTS meetings (
+    id SERIAL PRIMARY KEY,
+    filename VARCHAR NOT NULL,
+    transcript TEXT,
+    summary TEXT,
+    language VARCHAR(8),
+    duration_seconds DOUBLE PRECISION,
+    keywords TEXT,
+    created_at TIMESTAMP WITHOUT TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS ix_meetings_id ON meetings(id);
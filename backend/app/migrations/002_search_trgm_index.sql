@@ -0,0 +1,16 @@
+-- Single trigram index over the text /search matches against
+-- The expression must stay identical to SEARCH_DOCUMENT in app/main.py,
+-- otherwise the planner cannot use the index
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS meetings_trgm_idx ON meetings USING gin (
+    (coalesce(filename, '') || ' ' || coalesce(transcript, '') || ' ' ||
+     coalesce(summary, '')) gin_trgm_ops
+);
+
+-- Superseded by meetings_trgm_idx; dropping them saves a GIN update per write
+DROP INDEX IF EXISTS idx_meetings_transcript_gin;
+DROP INDEX IF EXISTS idx_meetings_summary_gin;
+
+ANALYZE meetings;
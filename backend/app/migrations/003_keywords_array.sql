@@ -0,0 +1,11 @@
+-- Store keywords as text[] so reads need no comma splitting
+
+-- The btree index from 001 was built on the CSV text; replace it with GIN
+DROP INDEX IF EXISTS idx_meetings_keywords;
+
+ALTER TABLE meetings
+    ALTER COLUMN keywords TYPE text[]
+    USING regexp_split_to_array(nullif(btrim(keywords), ''), '\s*,\s*');
+
+CREATE INDEX IF NOT EXISTS idx_meetings_keywords_gin
+    ON meetings USING gin (keywords);
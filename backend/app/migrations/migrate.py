@@ -3,6 +3,7 @@
 Database migration runner for Meeting Insights
 """
 
+import hashlib
 import os
 import sys
 import logging
@@ -37,40 +38,54 @@ def run_migrations():
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS migration_history (
                 filename VARCHAR(255) PRIMARY KEY,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                checksum VARCHAR(64)
             )
         """))
+        # Tables created before checksums existed get the column once;
+        # checking first avoids taking a DDL lock on every startup
+        has_checksum = conn.execute(text("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = 'migration_history'
+              AND column_name = 'checksum'
+        """)).first()
+        if has_checksum is None:
+            conn.execute(text(
+                "ALTER TABLE migration_history "
+                "ADD COLUMN checksum VARCHAR(64)"
+            ))
         conn.commit()
 
+        # One query for everything already applied
+        applied = dict(conn.execute(
+            text("SELECT filename, checksum FROM migration_history")
+        ).fetchall())
+
         for migration_file in migration_files:
             filename = migration_file.name
-
-            # Check if migration already applied
-            result = conn.execute(
-                text("SELECT filename FROM migration_history "
-                     "WHERE filename = :filename"),
-                {"filename": filename}
-            )
-
-            if result.fetchone():
+            migration_bytes = migration_file.read_bytes()
+            checksum = hashlib.sha256(migration_bytes).hexdigest()
+
+            if filename in applied:
+                # Rows recorded before checksums existed have none
+                if applied[filename] not in (None, checksum):
+                    logger.warning(f"Migration {filename} changed after it "
+                                   f"was applied (checksum mismatch)")
                 logger.info(f"Migration {filename} already applied, skipping")
                 continue
 
             logger.info(f"Applying migration: {filename}")
 
             try:
-                # Read and execute migration
-                with open(migration_file, 'r') as f:
-                    migration_sql = f.read()
-
                 # Execute migration
-                conn.execute(text(migration_sql))
+                conn.execute(text(migration_bytes.decode("utf-8")))
 
                 # Record migration as applied
                 conn.execute(
-                    text("INSERT INTO migration_history (filename) "
-                         "VALUES (:filename)"),
-                    {"filename": filename}
+                    text("INSERT INTO migration_history (filename, checksum) "
+                         "VALUES (:filename, :checksum)"),
+                    {"filename": filename, "checksum": checksum}
                 )
 
                 conn.commit()
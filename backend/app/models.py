@@ -1,8 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float
+from sqlalchemy import (ARRAY, Column, Integer, String, Text, DateTime,
+                        Float, Index)
 from datetime import datetime, timezone
 from .db import Base
 
 
+def utc_now() -> datetime:
+    """Current UTC time without tzinfo, as TIMESTAMP WITHOUT TIME ZONE
+    expects; asyncpg rejects aware datetimes for that type."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Meeting(Base):
     __tablename__ = "meetings"
     id = Column(Integer, primary_key=True, index=True)
@@ -11,5 +18,10 @@ class Meeting(Base):
     summary = Column(Text)
     language = Column(String(8))
     duration_seconds = Column(Float)
-    keywords = Column(Text)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    keywords = Column(ARRAY(Text))
+    created_at = Column(DateTime, default=utc_now)
+
+    __table_args__ = (
+        # Same index as migrations/001; serves ORDER BY created_at DESC
+        Index("idx_meetings_created_at", created_at.desc()),
+    )
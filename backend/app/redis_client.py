@@ -1,7 +1,7 @@
 import os
 import redis
-import json
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 
 
@@ -20,11 +20,54 @@ def get_redis_client():
     )
 
 
+# Job state lives in a hash so transitions only write the fields that
+# change. Hash values come back as strings; these restore their types.
+_INT_FIELDS = ("meeting_id", "attempts", "max_attempts")
+_JSON_FIELDS = ("result",)
+
+
+def _decode_job(raw: Dict[str, str]) -> Dict[str, Any]:
+    job = dict(raw)
+    for field in _INT_FIELDS:
+        if field in job:
+            job[field] = int(job[field])
+    for field in _JSON_FIELDS:
+        if field in job:
+            job[field] = orjson.loads(job[field])
+    return job
+
+
+# Writes the changed fields, refreshes the TTL and optionally requeues,
+# but only while the job hash still exists; HSET on an expired record
+# would recreate it with nothing but the changed fields.
+# KEYS: job hash, queue. ARGV: ttl, queue entry ("" for none), fields.
+_UPDATE_JOB_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if ARGV[2] ~= '' then
+    redis.call('LPUSH', KEYS[2], ARGV[2])
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+def _update_job_args(ttl: int, changes: Dict[str, Any],
+                     requeue: bytes = b"") -> list:
+    args = [ttl, requeue]
+    for field, value in changes.items():
+        args += [field, value]
+    return args
+
+
 class TaskQueue:
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
         self.queue_name = "meeting_processing_queue"
         self.processing_set = "processing_meetings"
+        self._update_job = self.redis.register_script(_UPDATE_JOB_LUA)
 
     def enqueue_meeting_job(self, meeting_id: int, file_path: str,
                             filename: str) -> str:
@@ -40,16 +83,15 @@ class TaskQueue:
             "attempts": 0,
             "max_attempts": 3
         }
+        key = f"job:{job_data['id']}"
 
-        # Add to queue
-        self.redis.lpush(self.queue_name, json.dumps(job_data))
-
-        # Store job details with expiration (24 hours)
-        self.redis.setex(
-            f"job:{job_data['id']}",
-            86400,
-            json.dumps(job_data)
-        )
+        with self.redis.pipeline(transaction=True) as pipe:
+            # Add to queue
+            pipe.lpush(self.queue_name, orjson.dumps(job_data))
+            # Store job details with expiration (24 hours)
+            pipe.hset(key, mapping=job_data)
+            pipe.expire(key, 86400)
+            pipe.execute()
 
         return job_data["id"]
 
@@ -58,19 +100,20 @@ class TaskQueue:
         result = self.redis.brpop(self.queue_name, timeout=30)
         if result:
             _, job_json = result
-            job_data = json.loads(job_json)
-
-            # Mark as processing
-            self.redis.sadd(self.processing_set, job_data["id"])
-            job_data["status"] = "processing"
-            job_data["started_at"] = datetime.now(timezone.utc).isoformat()
-
-            # Update job details
-            self.redis.setex(
-                f"job:{job_data['id']}",
-                86400,
-                json.dumps(job_data)
-            )
+            job_data = orjson.loads(job_json)
+            key = f"job:{job_data['id']}"
+            changes = {
+                "status": "processing",
+                "started_at": datetime.now(timezone.utc).isoformat(),
+            }
+            job_data.update(changes)
+
+            # Mark as processing and update job details in one MULTI/EXEC
+            with self.redis.pipeline(transaction=True) as pipe:
+                pipe.sadd(self.processing_set, job_data["id"])
+                pipe.hset(key, mapping=changes)
+                pipe.expire(key, 86400)
+                pipe.execute()
 
             return job_data
         return None
@@ -78,50 +121,72 @@ class TaskQueue:
     def complete_job(self, job_id: str,
                      result_data: Dict[str, Any] = None):
         """Mark a job as completed."""
-        self.redis.srem(self.processing_set, job_id)
-
-        # Get current job data
-        job_json = self.redis.get(f"job:{job_id}")
-        if job_json:
-            job_data = json.loads(job_json)
-            job_data["status"] = "completed"
-            job_data["completed_at"] = datetime.now(timezone.utc).isoformat()
-            if result_data:
-                job_data["result"] = result_data
-
-            # Update with shorter expiration (1 hour)
-            self.redis.setex(f"job:{job_id}", 3600, json.dumps(job_data))
+        changes = {
+            "status": "completed",
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if result_data:
+            changes["result"] = orjson.dumps(result_data)
+
+        # Update with shorter expiration (1 hour), unless it already expired
+        key = f"job:{job_id}"
+        with self.redis.pipeline(transaction=True) as pipe:
+            pipe.srem(self.processing_set, job_id)
+            self._update_job(keys=[key, self.queue_name],
+                             args=_update_job_args(3600, changes),
+                             client=pipe)
+            pipe.execute()
 
     def fail_job(self, job_id: str, error_message: str,
                  retry: bool = True):
         """Mark a job as failed and optionally retry."""
-        self.redis.srem(self.processing_set, job_id)
-
-        # Get current job data
-        job_json = self.redis.get(f"job:{job_id}")
-        if not job_json:
+        key = f"job:{job_id}"
+        with self.redis.pipeline(transaction=False) as pipe:
+            pipe.srem(self.processing_set, job_id)
+            pipe.hgetall(key)
+            _, raw = pipe.execute()
+        if not raw:
             return
 
-        job_data = json.loads(job_json)
-        job_data["attempts"] += 1
-        job_data["last_error"] = error_message
-        job_data["failed_at"] = datetime.now(timezone.utc).isoformat()
-
-        if retry and job_data["attempts"] < job_data["max_attempts"]:
-            # Retry: put back in queue
-            job_data["status"] = "queued"
-            self.redis.lpush(self.queue_name, json.dumps(job_data))
-        else:
-            # Max attempts reached
-            job_data["status"] = "failed"
-
-        self.redis.setex(f"job:{job_id}", 3600, json.dumps(job_data))
+        job_data = _decode_job(raw)
+        requeue = retry and job_data["attempts"] + 1 < job_data["max_attempts"]
+        changes = {
+            "attempts": job_data["attempts"] + 1,
+            "last_error": error_message,
+            "failed_at": datetime.now(timezone.utc).isoformat(),
+            # Retry puts it back in the queue; otherwise max attempts reached
+            "status": "queued" if requeue else "failed",
+        }
+        job_data.update(changes)
+
+        # Requeue and status change land together or not at all, and not
+        # if the record expired since it was read
+        entry = orjson.dumps(job_data) if requeue else b""
+        self._update_job(keys=[key, self.queue_name],
+                         args=_update_job_args(3600, changes, entry))
+
+    def requeue_job(self, job_data: Dict[str, Any]):
+        """Return a dequeued job that was never started to the queue."""
+        job_data = {k: v for k, v in job_data.items() if k != "started_at"}
+        job_data["status"] = "queued"
+        key = f"job:{job_data['id']}"
+        with self.redis.pipeline(transaction=True) as pipe:
+            pipe.srem(self.processing_set, job_data["id"])
+            # BRPOP pops from the right, so RPUSH makes it the next job
+            pipe.rpush(self.queue_name, orjson.dumps(job_data))
+            # Skipped if the record expired while the job sat prefetched
+            self._update_job(keys=[key, self.queue_name],
+                             args=_update_job_args(86400,
+                                                   {"status": "queued"}),
+                             client=pipe)
+            pipe.hdel(key, "started_at")
+            pipe.execute()
 
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get the current status of a job."""
-        job_json = self.redis.get(f"job:{job_id}")
-        if job_json:
-            return json.loads(job_json)
+        raw = self.redis.hgetall(f"job:{job_id}")
+        if raw:
+            return _decode_job(raw)
         return None
 
     def get_queue_length(self) -> int:
@@ -131,3 +196,11 @@ class TaskQueue:
     def get_processing_count(self) -> int:
         """Get the number of jobs currently being processed."""
         return self.redis.scard(self.processing_set)
+
+    def get_stats(self) -> Tuple[int, int]:
+        """Queue length and processing count in one round-trip."""
+        with self.redis.pipeline(transaction=False) as pipe:
+            pipe.llen(self.queue_name)
+            pipe.scard(self.processing_set)
+            queue_length, processing_count = pipe.execute()
+        return queue_length, processing_count
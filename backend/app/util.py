@@ -1,31 +1,50 @@
 import re
-from typing import List
-from pydub import AudioSegment
+import subprocess
+import wave
+from collections import Counter
+from typing import List, Optional
 
 
-def get_audio_duration_seconds(filepath: str) -> float:
-    audio = AudioSegment.from_file(filepath)
-    return round(len(audio) / 1000.0, 2)
+def get_audio_duration_seconds(filepath: str) -> Optional[float]:
+    # A WAV header already holds the frame count and rate
+    try:
+        with wave.open(filepath, "rb") as w:
+            return round(w.getnframes() / w.getframerate(), 2)
+    except (OSError, EOFError, wave.Error):
+        pass
+    # ffprobe reads the container header instead of decoding the audio
+    try:
+        out = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+             "-of", "default=nw=1:nk=1", filepath],
+            capture_output=True, text=True, check=True,
+        )
+        return round(float(out.stdout), 2)
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
 
 
-_STOPWORDS = {
+_STOPWORDS = frozenset({
     "the", "a", "an", "and", "or", "but", "if", "then", "else", "for", "on",
     "in", "of", "to", "is", "am", "are", "was", "were", "be", "been", "with",
     "by", "as", "at", "that", "this", "it", "its", "from", "we", "you", "i",
     "they", "he", "she", "them", "our", "your", "their", "not", "no", "yes",
     "do", "did", "done", "can", "could", "should",
-}
+})
+
+_KEYWORD_RE = re.compile(r"[A-Za-z][A-Za-z\-]{2,}")
+
+
+def count_keywords(freq: Counter, text: str) -> None:
+    """Add the keyword candidates in text to freq."""
+    freq.update(t for t in _KEYWORD_RE.findall(text.lower())
+                if t not in _STOPWORDS)
 
 
 def extract_keywords(text: str, top_k: int = 8) -> List[str]:
     if not text:
         return []
-    tokens = re.findall(r"[A-Za-z][A-Za-z\-]{2,}", text.lower())
-    freq = {}
-    for t in tokens:
-        if t in _STOPWORDS:
-            continue
-        freq[t] = freq.get(t, 0) + 1
-    sorted_terms = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-    return [t for t, _ in sorted_terms[:top_k]]
-    # TODO: optimize
+    # Counter counts in C; most_common(k) is a bounded heap, not a full sort
+    freq = Counter()
+    count_keywords(freq, text)
+    return [t for t, _ in freq.most_common(top_k)]
@@ -10,27 +10,43 @@ This worker service:
 - Has retry logic, logging, and health check endpoint
 """
 
+import asyncio
+import concurrent.futures
+import io
 import os
+import queue
+import subprocess
 import sys
 import logging
 import traceback
 import signal
 import threading
 import time
+import wave
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Union
 from datetime import datetime, timezone
 
-import openai
+import ctranslate2
+import numpy as np
+from openai import AsyncOpenAI
 from fastapi import FastAPI
-from faster_whisper import WhisperModel
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 # Add the app directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.db import SessionLocal  # noqa: E402
 from app.models import Meeting  # noqa: E402
 from app.redis_client import get_redis_client, TaskQueue  # noqa: E402
-from app.util import get_audio_duration_seconds, extract_keywords  # noqa: E402
+from app.util import count_keywords  # noqa: E402
+from app.whisper_runner import (  # noqa: E402
+    MODEL_PATH as WHISPER_CPP_MODEL,
+    WHISPER_BIN,
+    transcribe_with_whisper_cpp,
+)
 
 
 # Configure logging
@@ -42,27 +58,113 @@ logger = logging.getLogger(__name__)
 
 # Global variables
 _fw_model: Optional[WhisperModel] = None
+# BatchedInferencePipeline keeps per-call state on the instance, so each
+# worker thread wraps the shared model in its own
+_fw_pipelines = threading.local()
 _task_queue: Optional[TaskQueue] = None
 _worker_running = False
-_worker_thread: Optional[threading.Thread] = None
+_worker_threads: List[threading.Thread] = []
+_prefetch_thread: Optional[threading.Thread] = None
+_openai_client: Optional[AsyncOpenAI] = None
+_finish_loop: Optional[asyncio.AbstractEventLoop] = None
+_finish_thread: Optional[threading.Thread] = None
+_pending_finishes: Set[concurrent.futures.Future] = set()
+
+# Transcription threads sharing the one model; CTranslate2 drops the GIL
+WORKER_CONCURRENCY = max(1, int(os.getenv("WORKER_CONCURRENCY", "1")))
+
+# Jobs waiting dequeued and decoded while another one transcribes
+WORKER_PREFETCH = max(1, int(os.getenv("WORKER_PREFETCH",
+                                       WORKER_CONCURRENCY)))
+_prefetched: queue.Queue = queue.Queue(maxsize=WORKER_PREFETCH)
+
+# Jobs summarized at once; also caps in-flight OpenAI requests
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "4"))
+_openai_slots = asyncio.Semaphore(OPENAI_CONCURRENCY)
+_finish_slots = threading.BoundedSemaphore(OPENAI_CONCURRENCY)
+
+# "faster-whisper" (CTranslate2) or "whisper.cpp" (quantized GGML on CPU)
+WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "faster-whisper")
+
+# VAD chunks of one recording encoded per CTranslate2 call; <= 1 disables
+FW_BATCH_SIZE = int(os.getenv("FW_BATCH_SIZE", "8"))
+# Greedy decoding by default; a wider beam multiplies decoder work
+FW_BEAM_SIZE = int(os.getenv("FW_BEAM_SIZE", "1"))
+FW_MODEL = os.getenv("FW_MODEL", "base.en")
+# Fixing the language skips detection on multilingual models
+FW_LANG = os.getenv("FW_LANG") or ("en" if FW_MODEL.endswith(".en")
+                                   else None)
+# Physical cores split between the transcription threads
+FW_CPU_THREADS = int(os.getenv(
+    "FW_CPU_THREADS",
+    max(1, (os.cpu_count() or 2) // 2 // WORKER_CONCURRENCY)))
+
+# Transcripts longer than this many tokens are summarized map-reduce style
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "3000"))
+SUMMARY_CHUNK_OVERLAP = 200
+_encoding = None
+
+_SUMMARY_PROMPT = (
+    "Summarize the following meeting transcript in bullet points, "
+    "highlight action items, key decisions, and follow-up tasks. "
+    "Use clear English. Transcript:\n"
+)
+_CHUNK_PROMPT = (
+    "Summarize this part of a longer meeting transcript in bullet points, "
+    "keeping every action item, decision and follow-up task. Excerpt:\n"
+)
+_REDUCE_PROMPT = (
+    "Combine these partial summaries of one meeting into a single summary "
+    "in bullet points, highlight action items, key decisions, and "
+    "follow-up tasks. Use clear English. Partial summaries:\n"
+)
 
 # FastAPI app for health checks
-app = FastAPI(title="Meeting Processing Worker")
+app = FastAPI(title="Meeting Processing Worker",
+              default_response_class=ORJSONResponse)
+
+
+def _default_compute_type() -> str:
+    """Fastest compute type this CPU supports, int8 where available."""
+    supported = ctranslate2.get_supported_compute_types("cpu")
+    for compute_type in ("int8", "int8_float32"):
+        if compute_type in supported:
+            return compute_type
+    return "float32"
 
 
 def load_whisper_model():
     """Load the faster-whisper model."""
     global _fw_model
 
-    model_name = os.getenv("FW_MODEL", "base.en")
-    compute_type = os.getenv("FW_COMPUTE_TYPE", "float32")
+    if WHISPER_BACKEND == "whisper.cpp":
+        # whisper.cpp runs as a subprocess per job; just check it is there
+        for path in (WHISPER_BIN, WHISPER_CPP_MODEL):
+            if not Path(path).exists():
+                raise RuntimeError(f"whisper.cpp file not found: {path}")
+        logger.info(f"Using whisper.cpp model: {WHISPER_CPP_MODEL}")
+        return
+
+    compute_type = os.getenv("FW_COMPUTE_TYPE") or _default_compute_type()
 
-    logger.info(f"Loading faster-whisper model: {model_name}")
-    _fw_model = WhisperModel(model_name, device="cpu",
-                             compute_type=compute_type)
+    logger.info(f"Loading faster-whisper model: {FW_MODEL} "
+                f"({compute_type})")
+    _fw_model = WhisperModel(FW_MODEL, device="cpu",
+                             compute_type=compute_type,
+                             cpu_threads=FW_CPU_THREADS,
+                             num_workers=WORKER_CONCURRENCY)
     logger.info("Model loaded successfully")
 
 
+def _batched_pipeline() -> BatchedInferencePipeline:
+    """This thread's pipeline around the shared model."""
+    pipeline = getattr(_fw_pipelines, "pipeline", None)
+    if pipeline is None or pipeline.model is not _fw_model:
+        pipeline = BatchedInferencePipeline(model=_fw_model)
+        _fw_pipelines.pipeline = pipeline
+    return pipeline
+
+
 def initialize_services():
     """Initialize Redis and other services."""
     global _task_queue
@@ -83,8 +185,6 @@ def initialize_services():
 
 def _to_wav_16k_mono(src: Path) -> Path:
     """Convert audio file to 16kHz mono WAV format."""
-    import subprocess
-
     wav = src.with_suffix(".wav")
     cmd = ["ffmpeg", "-y", "-i", str(src), "-ar", "16000", "-ac", "1",
            str(wav)]
@@ -98,69 +198,198 @@ def _to_wav_16k_mono(src: Path) -> Path:
         raise
 
 
-def transcribe_audio(file_path: str) -> tuple[str, Optional[str]]:
-    """Transcribe audio file using faster-whisper."""
-    if _fw_model is None:
-        raise RuntimeError("faster-whisper model not loaded")
+def _decode_pcm_16k_mono(src: Path) -> np.ndarray:
+    """Decode audio with ffmpeg straight into a float32 waveform."""
+    cmd = ["ffmpeg", "-i", str(src), "-f", "s16le", "-ar", "16000",
+           "-ac", "1", "-"]
 
+    try:
+        proc = subprocess.run(cmd, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"FFmpeg decode failed: {e.stderr.decode()}")
+        raise
+    pcm = np.frombuffer(proc.stdout, dtype=np.int16)
+    return pcm.astype(np.float32) / 32768.0
+
+
+def load_audio(file_path: str) -> Union[np.ndarray, Path]:
+    """Decode ``file_path`` into the 16 kHz mono input the model reads.
+
+    faster-whisper takes the waveform in memory; whisper.cpp needs a WAV
+    file on disk.
+    """
     src_path = Path(file_path)
     if not src_path.exists():
         raise FileNotFoundError(f"Audio file not found: {file_path}")
 
-    logger.info(f"Starting transcription of {file_path}")
+    if WHISPER_BACKEND == "whisper.cpp":
+        return _to_wav_16k_mono(src_path)
+    return _decode_pcm_16k_mono(src_path)
+
 
-    # Convert to WAV format
-    wav_path = _to_wav_16k_mono(src_path)
+def discard_audio(file_path: str, audio: Union[np.ndarray, Path]):
+    """Clean up the temporary WAV file made by load_audio, if any."""
+    if isinstance(audio, Path) and audio.exists() \
+            and audio != Path(file_path):
+        audio.unlink()
 
+
+def transcribe_loaded(
+        file_path: str, audio: Union[np.ndarray, Path]
+) -> tuple[str, Optional[str], Optional[float], List[str]]:
+    """Transcribe audio prepared by load_audio, then discard it.
+
+    Returns the transcript, detected language, audio duration and top
+    keywords; the duration comes from the decode faster-whisper already
+    did, and keywords are counted as segments arrive.
+    """
     try:
-        # Transcribe
-        segments, info = _fw_model.transcribe(
-            str(wav_path),
-            beam_size=5,
-            vad_filter=True,
-        )
+        if WHISPER_BACKEND == "whisper.cpp":
+            return _transcribe_whisper_cpp(file_path, audio)
+
+        if _fw_model is None:
+            raise RuntimeError("faster-whisper model not loaded")
 
-        # Extract text and language
-        parts = [seg.text for seg in segments]
-        transcript = " ".join(parts).strip()
+        logger.info(f"Starting transcription of {file_path}")
+
+        # Transcribe
+        if FW_BATCH_SIZE > 1:
+            segments, info = _batched_pipeline().transcribe(
+                audio,
+                language=FW_LANG,
+                beam_size=FW_BEAM_SIZE,
+                batch_size=FW_BATCH_SIZE,
+            )
+        else:
+            segments, info = _fw_model.transcribe(
+                audio,
+                language=FW_LANG,
+                beam_size=FW_BEAM_SIZE,
+                condition_on_previous_text=False,
+                vad_filter=True,
+            )
+
+        # Extract text and keywords in a single pass over the segments
+        buf = io.StringIO()
+        freq = Counter()
+        for seg in segments:
+            buf.write(seg.text)
+            buf.write(" ")
+            count_keywords(freq, seg.text)
+        transcript = buf.getvalue().strip()
+        keywords = [t for t, _ in freq.most_common(8)]
         language = getattr(info, "language", None)
+        duration = getattr(info, "duration", None)
+        if duration is not None:
+            duration = round(duration, 2)
 
         logger.info(f"Transcription completed. Language: {language}, "
                     f"Length: {len(transcript)} chars")
-        return transcript, language
+        return transcript, language, duration, keywords
 
     finally:
-        # Clean up temporary WAV file
-        if wav_path.exists() and wav_path != src_path:
-            wav_path.unlink()
+        discard_audio(file_path, audio)
 
 
-def generate_summary(transcript: str) -> str:
-    """Generate summary using OpenAI."""
-    if not transcript.strip():
-        return ""
+def _transcribe_whisper_cpp(
+        file_path: str, wav_path: Path
+) -> tuple[str, Optional[str], Optional[float], List[str]]:
+    """Transcribe the decoded WAV with the whisper.cpp binary."""
+    logger.info(f"Starting whisper.cpp transcription of {file_path}")
 
-    logger.info("Generating summary with OpenAI")
+    language = FW_LANG or "en"
+    transcript = transcribe_with_whisper_cpp(str(wav_path), language)
+    freq = Counter()
+    count_keywords(freq, transcript)
+    keywords = [t for t, _ in freq.most_common(8)]
+    with wave.open(str(wav_path), "rb") as wav:
+        duration = round(wav.getnframes() / wav.getframerate(), 2)
 
-    prompt = (
-        "Summarize the following meeting transcript in bullet points, "
-        "highlight action items, key decisions, and follow-up tasks. "
-        "Use clear English. Transcript:\n"
-        + transcript
-    )
+    logger.info(f"Transcription completed. Language: {language}, "
+                f"Length: {len(transcript)} chars")
+    return transcript, language, duration, keywords
 
-    try:
-        completion = openai.chat.completions.create(
+
+def _model_loaded() -> bool:
+    return WHISPER_BACKEND == "whisper.cpp" or _fw_model is not None
+
+
+def transcribe_audio(
+        file_path: str
+) -> tuple[str, Optional[str], Optional[float], List[str]]:
+    """Transcribe audio file using the configured whisper backend."""
+    if not _model_loaded():
+        raise RuntimeError("faster-whisper model not loaded")
+    return transcribe_loaded(file_path, load_audio(file_path))
+
+
+def _get_encoding():
+    """The gpt-3.5-turbo tokenizer, or None if it cannot be loaded."""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
+        except Exception as e:
+            # tiktoken fetches its vocabulary on first use; don't retry
+            # the download for every job when that fails
+            logger.warning(f"Tokenizer unavailable, not chunking: {e}")
+            _encoding = False
+    return _encoding or None
+
+
+def _split_transcript(transcript: str) -> List[str]:
+    """Split into SUMMARY_CHUNK_TOKENS windows overlapping a little."""
+    enc = _get_encoding()
+    if enc is None:
+        return [transcript]
+
+    tokens = enc.encode(transcript)
+    if len(tokens) <= SUMMARY_CHUNK_TOKENS:
+        return [transcript]
+    step = SUMMARY_CHUNK_TOKENS - SUMMARY_CHUNK_OVERLAP
+    return [enc.decode(tokens[i:i + SUMMARY_CHUNK_TOKENS])
+            for i in range(0, len(tokens) - SUMMARY_CHUNK_OVERLAP, step)]
+
+
+async def _complete(instructions: str, text: str) -> str:
+    async with _openai_slots:
+        completion = await _openai_client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a meeting assistant."},
-                {"role": "user", "content": prompt}
+                {"role": "user", "content": instructions + text}
             ],
             temperature=0.2,
             max_tokens=512
         )
+    return completion.choices[0].message.content or ""
+
+
+async def generate_summary(transcript: str) -> str:
+    """Generate summary using OpenAI.
+
+    Long transcripts are summarized window by window in parallel, then
+    the partial summaries are merged by one final request.
+    """
+    if not transcript.strip():
+        return ""
+
+    logger.info("Generating summary with OpenAI")
+
+    try:
+        if _openai_client is None:
+            raise RuntimeError("OpenAI client not configured")
+
+        chunks = await asyncio.to_thread(_split_transcript, transcript)
+        if len(chunks) == 1:
+            summary = await _complete(_SUMMARY_PROMPT, transcript)
+        else:
+            logger.info(f"Summarizing {len(chunks)} transcript windows")
+            partials = await asyncio.gather(
+                *(_complete(_CHUNK_PROMPT, chunk) for chunk in chunks))
+            summary = await _complete(_REDUCE_PROMPT, "\n\n".join(partials))
 
-        summary = completion.choices[0].message.content or ""
         logger.info(f"Summary generated: {len(summary)} chars")
         return summary
 
@@ -171,25 +400,28 @@ def generate_summary(transcript: str) -> str:
 
 def update_meeting_record(meeting_id: int, transcript: str, summary: str,
                           language: Optional[str], duration: Optional[float],
-                          keywords: Optional[str]) -> bool:
+                          keywords: Optional[List[str]]) -> bool:
     """Update the meeting record in the database."""
+    # Same semantics as before: optional fields only overwrite when set
+    fields = {"transcript": transcript, "summary": summary}
+    if language:
+        fields["language"] = language
+    if duration is not None:
+        fields["duration_seconds"] = duration
+    if keywords:
+        fields["keywords"] = keywords
+
     db = SessionLocal()
     try:
-        meeting = db.get(Meeting, meeting_id)
-        if not meeting:
+        # One UPDATE instead of SELECT + ORM flush
+        result = db.execute(
+            update(Meeting).where(Meeting.id == meeting_id).values(**fields)
+        )
+        if result.rowcount == 0:
             logger.error(f"Meeting {meeting_id} not found in database")
+            db.rollback()
             return False
 
-        # Update fields
-        meeting.transcript = transcript
-        meeting.summary = summary
-        if language:
-            meeting.language = language
-        if duration is not None:
-            meeting.duration_seconds = duration
-        if keywords:
-            meeting.keywords = keywords
-
         db.commit()
         logger.info(f"Meeting {meeting_id} updated successfully")
         return True
@@ -202,83 +434,165 @@ def update_meeting_record(meeting_id: int, transcript: str, summary: str,
         db.close()
 
 
-def process_meeting_job(job_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Process a single meeting job."""
+async def finish_meeting_job(job_data: Dict[str, Any], transcript: str,
+                             language: Optional[str],
+                             duration: Optional[float],
+                             keywords_list: List[str]) -> Dict[str, Any]:
+    """Summarize a transcribed meeting and store the results."""
     job_id = job_data["id"]
     meeting_id = job_data["meeting_id"]
-    file_path = job_data["file_path"]
 
-    logger.info(f"Processing job {job_id} for meeting {meeting_id}")
+    # Generate summary
+    summary = await generate_summary(transcript)
 
-    try:
-        # Transcribe audio
-        transcript, language = transcribe_audio(file_path)
+    # Update database
+    success = await asyncio.to_thread(
+        update_meeting_record,
+        meeting_id, transcript, summary, language, duration, keywords_list
+    )
 
-        # Generate summary
-        summary = generate_summary(transcript)
+    if not success:
+        raise Exception("Failed to update database record")
 
-        # Extract keywords
-        keywords_list = extract_keywords(transcript, top_k=8)
-        keywords_str = ",".join(keywords_list) if keywords_list else None
+    logger.info(f"Job {job_id} completed successfully")
+    return {
+        "transcript_length": len(transcript),
+        "language": language,
+        "summary_length": len(summary),
+        "keywords_count": len(keywords_list) if keywords_list else 0,
+        "duration_seconds": duration
+    }
 
-        # Get audio duration
-        duration = get_audio_duration_seconds(file_path)
 
-        # Update database
-        success = update_meeting_record(
-            meeting_id, transcript, summary, language, duration, keywords_str
-        )
+async def _finish_and_record(job_data: Dict[str, Any], transcript: str,
+                             language: Optional[str],
+                             duration: Optional[float],
+                             keywords: List[str]):
+    job_id = job_data["id"]
+    try:
+        result = await finish_meeting_job(job_data, transcript, language,
+                                          duration, keywords)
+        await asyncio.to_thread(_task_queue.complete_job, job_id, result)
+        logger.info(f"Job {job_id} marked as completed")
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {e}")
+        logger.error(traceback.format_exc())
+        await asyncio.to_thread(_task_queue.fail_job, job_id, str(e), True)
+
+
+def _submit_finish(job_data: Dict[str, Any], transcript: str,
+                   language: Optional[str], duration: Optional[float],
+                   keywords: List[str]):
+    """Hand a transcribed job to the finishing loop.
+
+    Blocks while OPENAI_CONCURRENCY jobs are already being finished, so
+    transcripts cannot pile up faster than they are summarized.
+    """
+    _finish_slots.acquire()
+    future = asyncio.run_coroutine_threadsafe(
+        _finish_and_record(job_data, transcript, language, duration,
+                           keywords),
+        _finish_loop,
+    )
+    _pending_finishes.add(future)
 
-        if not success:
-            raise Exception("Failed to update database record")
+    def _done(f):
+        _pending_finishes.discard(f)
+        _finish_slots.release()
 
-        result = {
-            "transcript_length": len(transcript),
-            "language": language,
-            "summary_length": len(summary),
-            "keywords_count": len(keywords_list) if keywords_list else 0,
-            "duration_seconds": duration
-        }
+    future.add_done_callback(_done)
 
-        logger.info(f"Job {job_id} completed successfully")
-        return result
 
-    except Exception as e:
-        logger.error(f"Job {job_id} failed: {e}")
-        logger.error(traceback.format_exc())
-        raise
+def _put_prefetched(item) -> bool:
+    """Queue a prefetched job; gives up once the worker is stopping."""
+    while _worker_running:
+        try:
+            _prefetched.put(item, timeout=1)
+            return True
+        except queue.Full:
+            continue
+    return False
 
 
-def worker_loop():
-    """Main worker loop that processes jobs from the queue."""
+def prefetch_loop():
+    """Dequeue and decode upcoming jobs while the current one transcribes.
 
-    logger.info("Worker loop started")
+    At most WORKER_PREFETCH jobs wait decoded, so other worker replicas
+    still get their share of the queue.
+    """
+    logger.info("Prefetch loop started")
 
     while _worker_running:
         try:
             # Get next job (blocking with timeout)
             job_data = _task_queue.get_next_job()
+        except Exception as e:
+            logger.error(f"Prefetch error: {e}")
+            time.sleep(5)
+            continue
 
-            if job_data is None:
-                # Timeout - continue loop
-                continue
+        if job_data is None:
+            # Timeout - continue loop
+            continue
 
-            job_id = job_data["id"]
-            logger.info(f"Picked up job: {job_id}")
+        logger.info(f"Picked up job: {job_data['id']}")
+        try:
+            item = (job_data, load_audio(job_data["file_path"]), None)
+        except Exception as e:
+            item = (job_data, None, e)
+
+        if not _put_prefetched(item):
+            _release_prefetched(item)
+
+    logger.info("Prefetch loop stopped")
+
+
+def _release_prefetched(item):
+    """Hand an unprocessed job back to the queue for the next worker."""
+    job_data, audio, _ = item
+    if audio is not None:
+        discard_audio(job_data["file_path"], audio)
+    _task_queue.requeue_job(job_data)
+    logger.info(f"Job {job_data['id']} returned to the queue")
 
+
+def worker_loop():
+    """Main worker loop that processes jobs from the queue.
+
+    Jobs arrive already decoded from the prefetch loop. Transcription
+    runs here; summarizing and storing each result happens on the
+    finishing loop, so the next job's decode overlaps the OpenAI
+    round-trip of the previous one.
+    """
+
+    logger.info("Worker loop started")
+
+    while _worker_running:
+        try:
             try:
-                # Process the job
-                result = process_meeting_job(job_data)
+                job_data, audio, error = _prefetched.get(timeout=1)
+            except queue.Empty:
+                continue
 
-                # Mark as completed
-                _task_queue.complete_job(job_id, result)
-                logger.info(f"Job {job_id} marked as completed")
+            job_id = job_data["id"]
+            logger.info(f"Processing job {job_id} for meeting "
+                        f"{job_data['meeting_id']}")
 
+            try:
+                if error is not None:
+                    raise error
+                transcript, language, duration, keywords = transcribe_loaded(
+                    job_data["file_path"], audio)
             except Exception as e:
                 # Mark as failed (with retry if attempts remaining)
                 error_msg = str(e)
+                logger.error(traceback.format_exc())
                 _task_queue.fail_job(job_id, error_msg, retry=True)
                 logger.error(f"Job {job_id} failed: {error_msg}")
+                continue
+
+            _submit_finish(job_data, transcript, language, duration,
+                           keywords)
 
         except KeyboardInterrupt:
             logger.info("Worker interrupted by user")
@@ -293,21 +607,31 @@ def worker_loop():
 
 
 def start_worker():
-    """Start the worker in a separate thread."""
-    global _worker_running, _worker_thread
+    """Start the worker threads."""
+    global _worker_running, _prefetch_thread
+    global _finish_loop, _finish_thread
 
     if _worker_running:
         logger.warning("Worker already running")
         return
 
+    _finish_loop = asyncio.new_event_loop()
+    _finish_thread = threading.Thread(target=_finish_loop.run_forever,
+                                      daemon=True)
+    _finish_thread.start()
+
     _worker_running = True
-    _worker_thread = threading.Thread(target=worker_loop, daemon=True)
-    _worker_thread.start()
-    logger.info("Worker thread started")
+    _prefetch_thread = threading.Thread(target=prefetch_loop, daemon=True)
+    _prefetch_thread.start()
+    for _ in range(WORKER_CONCURRENCY):
+        thread = threading.Thread(target=worker_loop, daemon=True)
+        thread.start()
+        _worker_threads.append(thread)
+    logger.info(f"{WORKER_CONCURRENCY} worker thread(s) started")
 
 
 def stop_worker():
-    """Stop the worker thread."""
+    """Stop the worker threads."""
     global _worker_running
 
     if not _worker_running:
@@ -316,12 +640,31 @@ def stop_worker():
     logger.info("Stopping worker...")
     _worker_running = False
 
-    if _worker_thread:
-        _worker_thread.join(timeout=30)
-        if _worker_thread.is_alive():
+    if _worker_threads:
+        for thread in _worker_threads:
+            thread.join(timeout=30)
+        if any(thread.is_alive() for thread in _worker_threads):
             logger.warning("Worker thread did not stop gracefully")
         else:
             logger.info("Worker stopped successfully")
+        _worker_threads.clear()
+
+    # The prefetcher can sit in BRPOP for up to its 30s timeout
+    if _prefetch_thread:
+        _prefetch_thread.join(timeout=35)
+    while True:
+        try:
+            _release_prefetched(_prefetched.get_nowait())
+        except queue.Empty:
+            break
+
+    # Let jobs that were already transcribed finish storing their results
+    if _pending_finishes:
+        logger.info(f"Waiting for {len(_pending_finishes)} jobs to finish")
+        concurrent.futures.wait(list(_pending_finishes), timeout=60)
+    if _finish_loop:
+        _finish_loop.call_soon_threadsafe(_finish_loop.stop)
+        _finish_thread.join(timeout=5)
 
 
 def signal_handler(signum, frame):
@@ -332,29 +675,56 @@ def signal_handler(signum, frame):
 
 
 # Health check endpoints
+# Probes hit /health every few seconds per pod; Redis is asked at most
+# once per HEALTH_STATS_TTL and concurrent probes share the answer
+HEALTH_STATS_TTL = 1.0
+_redis_health: Dict[str, Any] = {}
+_redis_health_at = 0.0
+_redis_health_lock = asyncio.Lock()
+
+
+async def _get_redis_health() -> Dict[str, Any]:
+    global _redis_health, _redis_health_at
+    if time.monotonic() - _redis_health_at < HEALTH_STATS_TTL:
+        return _redis_health
+
+    async with _redis_health_lock:
+        # Another probe may have refreshed it while this one waited
+        if time.monotonic() - _redis_health_at < HEALTH_STATS_TTL:
+            return _redis_health
+
+        health = {
+            "redis_connected": False,
+            "queue_length": 0,
+            "processing_count": 0
+        }
+        try:
+            if _task_queue:
+                queue_length, processing_count = await asyncio.to_thread(
+                    _task_queue.get_stats)
+                health.update(redis_connected=True,
+                              queue_length=queue_length,
+                              processing_count=processing_count)
+        except Exception as e:
+            health["redis_error"] = str(e)
+
+        _redis_health = health
+        _redis_health_at = time.monotonic()
+        return health
+
+
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint."""
 
     status = {
         "status": "healthy",
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "worker_running": _worker_running,
-        "model_loaded": _fw_model is not None,
-        "redis_connected": False,
-        "queue_length": 0,
-        "processing_count": 0
+        "model_loaded": _model_loaded(),
+        **await _get_redis_health()
     }
-
-    # Check Redis connection
-    try:
-        if _task_queue:
-            _task_queue.redis.ping()
-            status["redis_connected"] = True
-            status["queue_length"] = _task_queue.get_queue_length()
-            status["processing_count"] = _task_queue.get_processing_count()
-    except Exception as e:
-        status["redis_error"] = str(e)
+    if "redis_error" in status:
         status["status"] = "unhealthy"
 
     return status
@@ -366,16 +736,18 @@ def get_stats():
     if not _task_queue:
         return {"error": "Queue not initialized"}
 
+    queue_length, processing_count = _task_queue.get_stats()
     return {
-        "queue_length": _task_queue.get_queue_length(),
-        "processing_count": _task_queue.get_processing_count(),
+        "queue_length": queue_length,
+        "processing_count": processing_count,
         "worker_running": _worker_running,
-        "model_loaded": _fw_model is not None
+        "model_loaded": _model_loaded()
     }
 
 
 def main():
     """Main entry point for the worker service."""
+    global _openai_client
     logger.info("Starting Meeting Processing Worker")
 
     # Set up signal handlers
@@ -384,8 +756,10 @@ def main():
 
     try:
         # Initialize OpenAI
-        openai.api_key = os.getenv("OPENAI_API_KEY")
-        if not openai.api_key:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key:
+            _openai_client = AsyncOpenAI(api_key=api_key)
+        else:
             logger.warning("OPENAI_API_KEY not set - summary generation "
                            "will fail")
 
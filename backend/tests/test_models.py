@@ -0,0 +1,41 @@
+import unittest
+
+from asyncpg.pgproto.pgproto import pg_epoch_datetime
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.models import Meeting, utc_now
+
+
+def _bound_created_at(created_at):
+    """Compile a meetings INSERT for asyncpg and return the SQL and the
+    created_at value as it would reach the driver."""
+    compiled = insert(Meeting).values(
+        filename="a.wav", created_at=created_at
+    ).compile(dialect=asyncpg.dialect())
+    params = compiled.construct_params()
+    processor = compiled._bind_processors.get("created_at")
+    value = params["created_at"]
+    return compiled.string, processor(value) if processor else value
+
+
+class CreatedAtBindTest(unittest.TestCase):
+    def assert_encodable(self, value):
+        # asyncpg encodes TIMESTAMP WITHOUT TIME ZONE as the offset from
+        # its naive epoch; an aware datetime raises TypeError here
+        self.assertIsNone(value.tzinfo)
+        value - pg_epoch_datetime
+
+    def test_explicit_created_at(self):
+        sql, value = _bound_created_at(utc_now())
+        self.assertIn("::TIMESTAMP WITHOUT TIME ZONE", sql)
+        self.assert_encodable(value)
+
+    def test_column_default(self):
+        default = Meeting.__table__.c.created_at.default
+        _, value = _bound_created_at(default.arg(None))
+        self.assert_encodable(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
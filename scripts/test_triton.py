@@ -4,15 +4,32 @@ Test script for Triton inference server
 Demonstrates keyword extraction model
 """
 
+import argparse
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import time
 import sys
 
+try:
+    import orjson
+    dumps, loads = orjson.dumps, orjson.loads
+except ImportError:
+    import json
+    dumps = lambda obj: json.dumps(obj).encode()  # noqa: E731
+    loads = json.loads
+
+# Triton's gRPC port as published by docker-compose
+GRPC_URL = "localhost:8004"
+
+# One keep-alive connection pool shared by every request to Triton
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+SESSION.headers.update({"Content-Type": "application/json"})
+
 def test_triton_health(base_url="http://localhost:8003"):
     """Test if Triton server is healthy."""
     try:
-        response = requests.get(f"{base_url}/v2/health/ready", timeout=5)
+        response = SESSION.get(f"{base_url}/v2/health/ready", timeout=5)
         if response.status_code == 200:
             print("✅ Triton server is ready")
             return True
@@ -23,11 +40,8 @@ def test_triton_health(base_url="http://localhost:8003"):
         print(f"❌ Triton server not reachable: {e}")
         return False
 
-def test_keyword_extraction(base_url="http://localhost:8003"):
-    """Test keyword extraction model."""
-    
-    # Sample meeting text
-    test_text = """
+# Sample meeting text
+TEST_TEXT = """
     Good morning everyone. Today's meeting will focus on reviewing our project timeline 
     and discussing action items from last week. We need to make important decisions 
     about the budget allocation and set deadlines for the upcoming tasks. 
@@ -35,6 +49,54 @@ def test_keyword_extraction(base_url="http://localhost:8003"):
     address some concerns about the testing strategy. Let's review the status update 
     and plan our next steps for the following week.
     """
+
+def print_keywords(keywords, scores, processing_time, test_text):
+    """Print the extracted keywords and their scores."""
+    print("✅ Keyword extraction successful!")
+    print(f"📊 Processing time: {processing_time:.2f}ms")
+    print(f"📝 Input length: {len(test_text)} characters")
+    print(f"🔑 Extracted {len(keywords)} keywords:")
+    print("\n".join(
+        f"   {i+1}. {keyword} (score: {score:.3f})"
+        for i, (keyword, score) in enumerate(zip(keywords, scores))
+    ))
+
+def test_keyword_extraction_grpc(grpc_url=GRPC_URL):
+    """Test keyword extraction over gRPC; tensors travel as protobuf, not JSON."""
+    import numpy as np
+    import tritonclient.grpc as grpcclient
+    
+    test_text = TEST_TEXT
+    
+    try:
+        client = grpcclient.InferenceServerClient(grpc_url)
+        try:
+            inp = grpcclient.InferInput("INPUT_TEXT", [1, 1], "BYTES")
+            inp.set_data_from_numpy(np.array([[test_text.encode("utf-8")]], dtype=object))
+            
+            start_time = time.perf_counter()
+            result = client.infer("keyword_extractor", [inp])
+            processing_time = (time.perf_counter() - start_time) * 1000
+            
+            # Outputs come back in model order: keywords, then scores
+            outputs = [result.as_numpy(out.name).ravel()
+                       for out in result.get_response().outputs]
+        finally:
+            client.close()
+        
+        keywords = [k.decode("utf-8") if isinstance(k, bytes) else k for k in outputs[0]]
+        scores = outputs[1].tolist()
+        print_keywords(keywords, scores, processing_time, test_text)
+        return True
+        
+    except Exception as e:
+        print(f"❌ Inference error: {e}")
+        return False
+
+def test_keyword_extraction(base_url="http://localhost:8003"):
+    """Test keyword extraction model."""
+    
+    test_text = TEST_TEXT
     
     # Prepare inference request
     inference_request = {
@@ -49,32 +111,24 @@ def test_keyword_extraction(base_url="http://localhost:8003"):
     }
     
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        response = requests.post(
+        response = SESSION.post(
             f"{base_url}/v2/models/keyword_extractor/infer",
-            json=inference_request,
-            headers={"Content-Type": "application/json"},
+            data=dumps(inference_request),
             timeout=30
         )
         
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter() - start_time) * 1000
         
         if response.status_code == 200:
-            result = response.json()
+            result = loads(response.content)
             
             # Extract outputs
-            keywords = [k for k in result["outputs"][0]["data"]]
+            keywords = result["outputs"][0]["data"]
             scores = result["outputs"][1]["data"]
             
-            print("✅ Keyword extraction successful!")
-            print(f"📊 Processing time: {processing_time:.2f}ms")
-            print(f"📝 Input length: {len(test_text)} characters")
-            print(f"🔑 Extracted {len(keywords)} keywords:")
-            
-            for i, (keyword, score) in enumerate(zip(keywords, scores)):
-                print(f"   {i+1}. {keyword} (score: {score:.3f})")
-            
+            print_keywords(keywords, scores, processing_time, test_text)
             return True
         else:
             print(f"❌ Inference failed: {response.status_code}")
@@ -88,9 +142,9 @@ def test_keyword_extraction(base_url="http://localhost:8003"):
 def test_triton_model_info(base_url="http://localhost:8003"):
     """Get model information from Triton."""
     try:
-        response = requests.get(f"{base_url}/v2/models/keyword_extractor", timeout=5)
+        response = SESSION.get(f"{base_url}/v2/models/keyword_extractor", timeout=5)
         if response.status_code == 200:
-            model_info = response.json()
+            model_info = loads(response.content)
             print("📋 Model Information:")
             print(f"   Name: {model_info['name']}")
             print(f"   Backend: {model_info['backend']}")
@@ -107,6 +161,20 @@ def test_triton_model_info(base_url="http://localhost:8003"):
 
 def main():
     """Main test function."""
+    parser = argparse.ArgumentParser(description="Test the Triton keyword extractor")
+    parser.add_argument("--http", action="store_true",
+                        help="send the inference request as JSON over HTTP instead of gRPC")
+    args = parser.parse_args()
+    
+    use_grpc = not args.http
+    if use_grpc:
+        try:
+            import tritonclient.grpc  # noqa: F401
+        except ImportError:
+            print("⚠️  tritonclient not installed, using HTTP for inference")
+            print("💡 Install with: pip install 'tritonclient[grpc]'")
+            use_grpc = False
+    
     print("🧪 Testing Triton Inference Server")
     print("=" * 50)
     
@@ -125,7 +193,11 @@ def main():
     print()
     
     # Test inference
-    success = test_keyword_extraction(base_url)
+    if use_grpc:
+        print(f"📡 Inference over gRPC ({GRPC_URL})")
+        success = test_keyword_extraction_grpc(GRPC_URL)
+    else:
+        success = test_keyword_extraction(base_url)
     
     print("\n" + "=" * 50)
     if success: